@@ -8,3 +8,17 @@ class PostForm(forms.ModelForm):
         widgets = {
             'content': forms.Textarea(attrs={'rows': 10}),
         }
+
+    def save(self, commit=True, author=None):
+        post = super().save(commit=False)
+        if author is not None:
+            post.author = author
+        if commit:
+            if post.pk is not None and author is None:
+                # Edit path: write only the columns the form changed.
+                # updated_at is auto_now, which only refreshes when it is
+                # listed in update_fields; Post.save adds slug if needed.
+                post.save(update_fields=self.changed_data + ['updated_at'])
+            else:
+                post.save()
+        return post
@@ -3,10 +3,15 @@ from django.contrib.auth.models import User
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
 from .models import Post
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
 import io
+import os
 from PIL import Image
+import cloudinary.api
 import cloudinary.uploader
 
+@skipUnless(os.environ.get('LIVE_CLOUDINARY'), 'Set LIVE_CLOUDINARY=1 to run real Cloudinary uploads')
 class LiveCloudinaryIntegrationTest(TestCase):
     '''
     Real integration test with Cloudinary API.
@@ -14,32 +19,41 @@ class LiveCloudinaryIntegrationTest(TestCase):
     Only run when you need to verify real integration.
     '''
     
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Encode the test image once; the bytes never change between tests
+        image = Image.new('RGB', (200, 200), color='blue')
+        image_file = io.BytesIO()
+        image.save(image_file, format='PNG')
+        cls._image_bytes = image_file.getvalue()
+
     def setUp(self):
         self.client = Client()
         self.user = User.objects.create_user(
             username='livetest',
             password='LiveTest123!'
         )
-        self.client.login(username='livetest', password='LiveTest123!')
+        self.client.force_login(self.user)
         self.create_url = reverse('post_create')
         self.uploaded_public_ids = []
     
     def tearDown(self):
-        # Clean up uploaded images from Cloudinary
-        for public_id in self.uploaded_public_ids:
-            try:
-                cloudinary.uploader.destroy(public_id)
-            except:
-                pass
+        # Clean up uploaded images from Cloudinary in one Admin API call
+        # (delete_resources accepts up to 100 public_ids per request)
+        if self.uploaded_public_ids:
+            ids = self.uploaded_public_ids
+            for chunk in (ids[i:i + 100] for i in range(0, len(ids), 100)):
+                try:
+                    cloudinary.api.delete_resources(chunk)
+                except:
+                    pass
     
     def create_test_image(self):
-        image = Image.new('RGB', (200, 200), color='blue')
-        image_file = io.BytesIO()
-        image.save(image_file, format='PNG')
-        image_file.seek(0)
+        # SimpleUploadedFile copies the cached bytes, so tests stay isolated
         return SimpleUploadedFile(
             name='live_test.png',
-            content=image_file.read(),
+            content=self._image_bytes,
             content_type='image/png'
         )
     
@@ -73,4 +87,22 @@ class LiveCloudinaryIntegrationTest(TestCase):
         detail_url = reverse('post_detail', kwargs={'slug': post.slug})
         response = self.client.get(detail_url)
         self.assertEqual(response.status_code, 200)
-        self.assertIn(post.featured_image.url, response.content.decode())
\ No newline at end of file
+        self.assertIn(post.featured_image.url, response.content.decode())
+
+    def test_concurrent_cloudinary_uploads(self):
+        '''Test uploading a batch of images to Cloudinary concurrently'''
+
+        def upload_one(_):
+            # Call the uploader directly: the test client is thread-bound,
+            # and here only the Cloudinary round trip is under test
+            return cloudinary.uploader.upload(self._image_bytes)
+
+        # Serial uploads pay one full round trip each; a thread pool
+        # overlaps them so wall time is roughly one round trip total
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(upload_one, range(5)))
+
+        for result in results:
+            self.assertIn('public_id', result)
+            self.assertIn('cloudinary.com', result['secure_url'])
+            self.uploaded_public_ids.append(result['public_id'])
\ No newline at end of file
@@ -1,4 +1,7 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.utils.text import slugify
 from django.urls import reverse
@@ -21,14 +24,38 @@ class Post(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at'], name='post_status_created_idx'),
+            models.Index(fields=['author', '-created_at'], name='post_author_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
     def save(self, *args, **kwargs):
-        if not self.slug or slugify(self.title) != self.slug:
-            self.slug = slugify(self.title)
+        update_fields = kwargs.get('update_fields')
+        # Only re-slugify when the title may have changed: skip when an
+        # update_fields save doesn't touch it, or when the title matches
+        # the one the current slug was generated from
+        if update_fields is None or 'title' in update_fields:
+            if getattr(self, '_slug_source', None) != self.title:
+                if not self.slug or slugify(self.title) != self.slug:
+                    self.slug = slugify(self.title)
+                    if update_fields is not None:
+                        kwargs['update_fields'] = {'slug', *update_fields}
+                self._slug_source = self.title
         super().save(*args, **kwargs)
     
     def get_absolute_url(self):
-        return reverse('post_detail', kwargs={'slug': self.slug})
\ No newline at end of file
+        return reverse('post_detail', kwargs={'slug': self.slug})
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def bump_post_list_version(sender, **kwargs):
+    # The post_list template fragment is keyed on this counter, so any
+    # save or delete invalidates the cached list on the next request
+    try:
+        cache.incr('post_list_version')
+    except ValueError:
+        cache.set('post_list_version', 1, None)
\ No newline at end of file
@@ -1,5 +1,9 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.http import StreamingHttpResponse
+from django.template.loader import render_to_string
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import login
 from django.contrib import messages
@@ -7,11 +11,29 @@ from .models import Post
 from .forms import PostForm
 
 def post_list(request):
-    posts = Post.objects.filter(status='published')
-    return render(request, 'blog/post_list.html', {'posts': posts})
+    paginator = Paginator(
+        Post.objects.filter(status='published').select_related('author').defer('status', 'updated_at'),
+        20,
+    )
+    posts = paginator.get_page(request.GET.get('page'))
+    # Fragment-cache version; bumped by the Post save/delete signal
+    version = cache.get_or_set('post_list_version', 0, None)
+    return render(request, 'blog/post_list.html', {'posts': posts, 'post_list_version': version})
+
+def post_list_stream(request):
+    # Feed-style listing of every published post. Rows are rendered and
+    # sent as they arrive from the database, so time-to-first-byte and
+    # peak memory stay bounded by chunk_size instead of the table size.
+    def generate():
+        yield '<!DOCTYPE html>\n<html>\n<body>\n<h1>Blog Posts</h1>\n'
+        posts = Post.objects.filter(status='published').select_related('author').iterator(chunk_size=500)
+        for post in posts:
+            yield render_to_string('blog/_post_row.html', {'post': post})
+        yield '</body>\n</html>\n'
+    return StreamingHttpResponse(generate())
 
 def post_detail(request, slug):
-    post = get_object_or_404(Post, slug=slug, status='published')
+    post = get_object_or_404(Post.objects.select_related('author'), slug=slug, status='published')
     return render(request, 'blog/post_detail.html', {'post': post})
 
 @login_required
@@ -19,9 +41,7 @@ def post_create(request):
     if request.method == 'POST':
         form = PostForm(request.POST, request.FILES)
         if form.is_valid():
-            post = form.save(commit=False)
-            post.author = request.user
-            post.save()
+            form.save(author=request.user)
             messages.success(request, 'Post created successfully!')
             return redirect('my_posts')
     else:
@@ -52,7 +72,8 @@ def post_delete(request, slug):
 
 @login_required
 def my_posts(request):
-    posts = Post.objects.filter(author=request.user)
+    paginator = Paginator(Post.objects.filter(author=request.user).defer('updated_at'), 20)
+    posts = paginator.get_page(request.GET.get('page'))
     return render(request, 'blog/my_posts.html', {'posts': posts})
 
 def signup(request):
@@ -0,0 +1,25 @@
+"""
+Test-only settings overrides.
+
+Run the suite with:
+    python manage.py test --settings=test_settings --keepdb
+"""
+
+from blog_project.settings import *  # noqa: F401,F403
+
+# An in-memory database avoids disk I/O for schema creation and per-test
+# transaction work; --keepdb skips re-running migrations between runs.
+# The live Cloudinary tests still need network and are opted into
+# separately via the LIVE_CLOUDINARY environment variable.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# PBKDF2 dominates the wall time of every test that creates or
+# authenticates a user. MD5 is insecure but fine for throwaway test data.
+PASSWORD_HASHERS = (
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+)